@@ -1,27 +1,37 @@
+import importlib
+
 from .emission_track import (
-    Tracker, 
     track,
+    clear_cache,
     __version__
 
 )
 
-from eco2ai.tools.tools_cpu import (
-    CPU,
-    all_available_cpu
-)
+# Classes and functions below are imported on the first access to them,
+# so "import eco2ai" doesn't load pandas, pynvml and other dependencies of the Tracker
+_LAZY_ATTRIBUTES = {
+    "Tracker": "eco2ai._tracker_impl",
+    "CPU": "eco2ai.tools.tools_cpu",
+    "all_available_cpu": "eco2ai.tools.tools_cpu",
+    "GPU": "eco2ai.tools.tools_gpu",
+    "all_available_gpu": "eco2ai.tools.tools_gpu",
+    "RAM": "eco2ai.tools.tools_ram",
+    "available_devices": "eco2ai.utils",
+    "set_params": "eco2ai.utils",
+    "get_params": "eco2ai.utils",
+    "summary": "eco2ai.utils",
+}
 
-from eco2ai.tools.tools_gpu import (
-    GPU,
-    all_available_gpu
-)
+__all__ = ["track", "clear_cache", "__version__", *_LAZY_ATTRIBUTES]
 
-from eco2ai.tools.tools_ram import (
-    RAM,
-)
 
-from eco2ai.utils import (
-    available_devices,
-    set_params,
-    get_params,
-    summary,
-)
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attribute = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
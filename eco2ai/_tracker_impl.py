@@ -0,0 +1,1464 @@
+import os
+import io
+import csv
+import time
+import struct
+import threading
+import multiprocessing
+import platform
+import pandas as pd
+import numpy as np
+import uuid
+import warnings
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # shared memory is available since python 3.8, without it rows are written by the current process
+    shared_memory = None
+
+from eco2ai.tools.tools_gpu import GPU, all_available_gpu
+from eco2ai.tools.tools_cpu import CPU, all_available_cpu
+from eco2ai.tools.tools_ram import RAM
+from eco2ai.utils import (
+    file_lock,
+    locked_open,
+    define_carbon_index,
+    get_params,
+    set_params,
+    # calculate_money,
+    # summary,
+    encode,
+    encode_dataframe,
+    electricity_pricing_check,
+    electricity_pricing_table,
+    FileDoesNotExistsError,
+    NotNeededExtensionError,
+)
+
+FROM_mWATTS_TO_kWATTH = 1000 * 1000 * 3600
+FROM_kWATTH_TO_MWATTH = 1000
+
+class IncorrectMethodSequenceError(Exception):
+    pass
+
+
+class _CsvWriter:
+    """
+    This class writes rows of a Tracker to .csv file.
+    The file is kept opened during a run of the Tracker, so the latest row of the run can be replaced in place.
+    It is used both by the Tracker and by the writer process (see "writer_process" parameter of the Tracker).
+    """
+
+    def __init__(self, file_name, columns):
+        """
+        This class method initializes a _CsvWriter object, the file is opened only by the first write
+
+        Parameters
+        ----------
+        file_name: str
+            Name of .csv file
+        columns: list
+            Columns of the .csv file
+
+        Returns
+        -------
+        _CsvWriter: _CsvWriter
+            Object of class _CsvWriter
+
+        """
+        self.file_name = file_name
+        self.columns = columns
+        # opened .csv file, offset of the latest row of the current run in it
+        # and (size, mtime) of the file right after the last write
+        self._file = None
+        self._row_offset = None
+        self._file_stat = None
+        # if True, header of the .csv file has been already checked,
+        # so it is not read again while the file is not empty
+        self._created = False
+        # rows, which are not written to the .csv file yet.
+        # If self._replace_row is True, the first of them replaces the latest written row of the run
+        self._pending_rows = []
+        self._replace_row = False
+        self._line_buffer = io.StringIO()
+        self._csv_writer = csv.writer(self._line_buffer, lineterminator=os.linesep)
+
+    def format_line(self, values):
+        """
+        This class method formats values as a single line of .csv file
+
+        Parameters
+        ----------
+        values: iterable
+            Values of one row
+
+        Returns
+        -------
+        line: bytes
+            Encoded .csv line, ending with line separator
+
+        """
+        self._line_buffer.seek(0)
+        self._line_buffer.truncate()
+        self._csv_writer.writerow(values)
+        return self._line_buffer.getvalue().encode("utf-8")
+
+    def new_run(self, file_name):
+        """
+        This class method signalizes that a new run of the Tracker is started,
+        so its first row is added to the file instead of replacing the latest one
+
+        Parameters
+        ----------
+        file_name: str
+            Name of .csv file of the run
+
+        Returns
+        -------
+        No returns
+
+        """
+        if file_name != self.file_name:
+            self.file_name = file_name
+            self._created = False
+        self._row_offset = None
+
+    def add_row(self, row, add_new=False):
+        """
+        This class method puts a row to the pending rows.
+        Until the rows are written, the latest pending row is replaced by the new one.
+
+        Parameters
+        ----------
+        row: tuple
+            Values of the row
+        add_new: bool
+            If True, the row is added after the latest one instead of replacing it.
+            The default is False
+
+        Returns
+        -------
+        No returns
+
+        """
+        if add_new or not self._pending_rows:
+            if not self._pending_rows:
+                self._replace_row = not add_new and self._row_offset is not None
+            self._pending_rows.append(row)
+        else:
+            self._pending_rows[-1] = row
+
+    def _rewrite_file(self, attributes_dataframe):
+        """
+        This class method replaces the whole content of the opened .csv file with a dataframe
+
+        Parameters
+        ----------
+        attributes_dataframe: pd.DataFrame
+            Dataframe to write
+
+        Returns
+        -------
+        No returns
+
+        """
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(attributes_dataframe.to_csv(index=False).encode("utf-8"))
+
+    def _update_to_new_version(self, attributes_dataframe):
+        """
+         This class method is a function, that updates dataframe to newer versions: adds new columns etc
+
+         Parameters
+         ----------
+         attributes_dataframe: pd.DataFrame
+             Dataframe to update
+
+         Returns
+         -------
+        dataframe: pd.DataFrame
+         Updated dataframe.
+
+        """
+        current_columns = list(attributes_dataframe.columns)
+        for column in self.columns:
+            if column not in current_columns:
+                attributes_dataframe[column] = "N/A"
+        attributes_dataframe = attributes_dataframe[self.columns]
+
+        return attributes_dataframe
+
+    def _open_file(self):
+        """
+        This class method opens .csv file, which is kept opened until the run ends.
+        If the file is empty, header is written to it.
+        If the file was created by an older version, it is updated to the new columns.
+        The header is checked only once, next runs just make sure the file is not empty.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        self._file = open(self.file_name, "ab+")
+        if self._created and os.fstat(self._file.fileno()).st_size:
+            return
+        with file_lock(self._file):
+            self._file.seek(0)
+            header = self._file.readline()
+            if not header:
+                self._file.write(self.format_line(self.columns))
+            elif header != self.format_line(self.columns):
+                self._file.seek(0)
+                attributes_dataframe = pd.read_csv(self._file, dtype=str, keep_default_na=False)
+                self._rewrite_file(self._update_to_new_version(attributes_dataframe))
+            self._file.flush()
+        self._created = True
+
+    def close(self):
+        """
+        This class method closes .csv file, the rows, which are not written yet, are dropped
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._row_offset = None
+        self._file_stat = None
+        self._pending_rows.clear()
+        self._replace_row = False
+
+    def flush(self, row_id, sync=False):
+        """
+        This class method writes pending rows to .csv file.
+        The row of the current run is the last one in the file, unless somebody else has written to it.
+        So, the row is updated by truncating the file at the row offset and appending new lines.
+        The whole file is read and rewritten only if it was changed since the last write.
+
+        Parameters
+        ----------
+        row_id: str
+            Id of the current run, it is used to find the row, if the file was changed by somebody else
+        sync: bool
+            If True, the file is synced to the disk after writing.
+            The default is False
+
+        Returns
+        -------
+        No returns
+
+        """
+        if not self._pending_rows:
+            return
+        if self._file is None:
+            self._open_file()
+        lines = [self.format_line(row) for row in self._pending_rows]
+
+        with file_lock(self._file):
+            file_stat = os.fstat(self._file.fileno())
+            if self._replace_row and self._file_stat != (file_stat.st_size, file_stat.st_mtime_ns):
+                # The file was changed by someone else, so the row is searched and updated with pandas
+                self._file.seek(0)
+                attributes_dataframe = pd.read_csv(self._file, dtype=str, keep_default_na=False)
+                rows = attributes_dataframe.index[attributes_dataframe["id"] == row_id]
+                if len(rows):
+                    attributes_dataframe.loc[rows[-1]] = [str(value) for value in self._pending_rows[0]]
+                    self._rewrite_file(attributes_dataframe)
+                    lines = lines[1:]
+                self._replace_row = False
+
+            if self._replace_row:
+                # Updating the last row
+                offset = self._row_offset
+                self._file.seek(offset)
+                self._file.truncate()
+            else:
+                # Adding new rows
+                offset = self._file.seek(0, os.SEEK_END)
+            if lines:
+                self._row_offset = offset + sum(len(line) for line in lines[:-1])
+                self._file.write(b"".join(lines))
+            self._file.flush()
+            if sync:
+                os.fsync(self._file.fileno())
+            if lines:
+                file_stat = os.fstat(self._file.fileno())
+                self._file_stat = (file_stat.st_size, file_stat.st_mtime_ns)
+            else:
+                self._file_stat = None
+        self._pending_rows.clear()
+
+
+class Tracker:
+    """
+    This class calculates CO2 emissions during CPU or GPU calculations
+    In order to calculate CPU & GPU power consumption correctly you should create the 'Tracker' before any CPU or GPU usage
+    It is recommended to create a new “Tracker” object per every new calculation.
+
+    Example
+    ----------
+    import eco2ai.Tracker
+    tracker = eco2ai.Tracker()
+
+    tracker.start()
+
+    *your CPU and GPU calculations*
+
+    tracker.stop()
+
+    """
+
+    # columns of the .csv file, which don't change during a single Tracker run
+    _STATIC_COLUMNS = (
+        "id",
+        "project_name",
+        "experiment_description",
+        "CPU_name",
+        "GPU_name",
+        "OS",
+        "region/country",
+    )
+
+    def __init__(
+        self,
+        project_name=None,
+        experiment_description=None,
+        file_name=None,
+        measure_period=10,
+        emission_level=None,
+        alpha_2_code=None,
+        region=None,
+        cpu_processes="current",
+        pue=1,
+        encode_file=None,
+        electricity_pricing=None,
+        ignore_warnings=False,
+        timezone=False,
+        writer_process=False,
+    ):
+        """
+        This class method initializes a Tracker object and creates fields of class object
+
+        Parameters
+        ----------
+        project_name: str
+            Specified by user project name.
+            The default is None
+        experiment_description: str
+            Specified by user experiment description.
+            The default is None
+        file_name: str
+            Name of file to save the the results of calculations.
+            The default is None
+        measure_period: float
+            Period of power consumption measurements in seconds.
+            The more period the more time between measurements.
+            The default is 10
+        emission_level: float
+            The mass of CO2 in kilos, which is produced  per every MWh of consumed energy.
+            The default is None
+        alpha_2_code: str
+            User specified country code.
+            User can search own country code here: https://www.iban.com/country-codes
+            Default is None
+        region: str
+            User specified country region/state/district.
+            Default is None
+        cpu_processes: str
+            if cpu_processes == "current", then calculates CPU utilization percent only for the current running process
+            if cpu_processes == "all", then calculates full CPU utilization percent(sum of all running processes)
+        pue: float
+            Power utilization efficiency.
+            It is ration of the total 'facility power' and 'IT equipment energy consumption'.
+            PUE is a measure of a data center power efficiency.
+            This parameter will be very essential during calculations using data centres facilities.
+            The default is 1.
+        encode_file: str
+            If this parameter is not None, results of calculations will be encoded
+            and the results will be written to file.
+            If this parameter == True encoded data will be written to file "encoded_" + value of file_name parameter.
+            So, default name of file with encoded data will be "encoded_emission.csv"
+            If this parameter is of str type, then name of file with encoded data will be value of encode_file parameter.
+            The default is None.
+        electricity_pricing: dict
+            Dictionary with time intervals as keys and electricity price during that intervals as values.
+            Electricity price should be set without any currency designation.
+            Every interval must be constructed as follows:
+                1) "hh:mm-hh:mm", hh - hours, mm - minutes. hh in [0, ..., 23], mm in [0, ..., 59]
+                2) Intervals should be consistent: they mustn't overlap and they should in chronological order.
+                Instance of consistent intervals: "8:30-19:00", "19:00-6:00", "6:00-8:30"
+                Instance of inconsistent intervals: "8:30-20:00", "18:00-3:00", "6:00-12:30"
+                3) Total duration of time intervals in hours must be 24 hours(1 day).
+        ignore_warnings: bool
+            If true, then user will be notified of all the warnings. If False, there won't be any warnings.
+            The default is False.
+        timezone: deprecated, is not used anymore.
+            It used to set the timezone of the measurement scheduler, which is now a simple periodic thread.
+        writer_process: bool
+            If True, after ".start" method the .csv file is written by a separate process,
+            which gets measurements through shared memory.
+            So, writing the file doesn't take time of the tracked code.
+            The process is started as "multiprocessing" module does it on the current platform,
+            so the main module of the program should be guarded by 'if __name__ == "__main__":'.
+            If shared memory is not available, the file is written by the current process.
+            Training tracking (".start_training" method) always writes the file in the current process.
+            The default is False.
+
+        Returns
+        -------
+        Tracker: Tracker
+            Object of class Tracker
+
+        """
+        self._ignore_warnings = ignore_warnings
+        if not self._ignore_warnings:
+            warnings.warn(
+                message="""
+If you use a VPN, you may have problems with identifying your country by IP.
+It is recommended to disable VPN or
+manually set up the ISO-Alpha-2 code of your country during initialization of the Tracker() class.
+You can find the ISO-Alpha-2 code of your country here: https://www.iban.com/country-codes
+"""
+            )
+        if (isinstance(measure_period, int) or isinstance(measure_period, float)) and measure_period <= 0:
+            raise ValueError("'measure_period' should be positive number")
+        if encode_file is not None:
+            if not isinstance(encode_file, str) and not encode_file:
+                raise TypeError(f"'encode_file' parameter should have str type, not {type(encode_file)}")
+            if isinstance(encode_file, str) and not encode_file.endswith(".csv"):
+                raise NotNeededExtensionError("'encode_file' name need to be with extension '.csv'")
+        if file_name is not None:
+            if isinstance(file_name, str) and not file_name:
+                raise TypeError(f"'file_name' parameter should have str type, not {type(file_name)}")
+            if isinstance(file_name, str) and not file_name.endswith(".csv"):
+                raise NotNeededExtensionError("'file_name' name need to be with extension '.csv'")
+        # default parameters are read only if some of the parameters are not specified
+        self._params_dict = None
+        if any(param is None for param in (project_name, experiment_description, file_name, measure_period, pue)):
+            self._params_dict = get_params()
+        self.project_name = project_name if project_name is not None else self._params_dict["project_name"]
+        self.experiment_description = (
+            experiment_description
+            if experiment_description is not None
+            else self._params_dict["experiment_description"]
+        )
+        self.file_name = file_name if file_name is not None else self._params_dict["file_name"]
+        self._measure_period = measure_period if measure_period is not None else self._params_dict["measure_period"]
+        self._pue = pue if pue is not None else self._params_dict["pue"]
+        self.get_set_params(
+            self.project_name, self.experiment_description, self.file_name, self._measure_period, self._pue
+        )
+
+        self._emission_level, self._country = define_carbon_index(emission_level, alpha_2_code, region)
+        # kilos of CO2 per every kWh of consumed energy
+        self._emission_factor = self._emission_level / FROM_kWATTH_TO_MWATTH
+        self._cpu_processes = cpu_processes
+        # thread, running self._func_for_sched every self._measure_period seconds, and event to stop it
+        self._thread = None
+        self._stop_event = None
+        self._start_time = None
+        self._start_time_str = None
+        self._cpu = None
+        self._gpu = None
+        self._ram = None
+        # function measuring GPU power consumption, it is chosen once the GPU availability is known
+        self._measure_gpu = None
+        # descriptions of devices, they don't change during the Tracker work
+        self._cpu_description = None
+        self._gpu_description = None
+        self._id = None
+        self._current_epoch = "N/A"
+        self._consumption = 0
+        self._encode_file = encode_file if not encode_file else "encoded_" + file_name
+        # encoded values of the static columns, they are encoded once per run
+        self._static_encoded = None
+        electricity_pricing_check(electricity_pricing)
+        self._electricity_pricing = electricity_pricing
+        if self._electricity_pricing is not None:
+            # start times of the pricing intervals in seconds since midnight and prices of the intervals
+            self._px_starts, self._px_rates = electricity_pricing_table(self._electricity_pricing)
+            self._price_fn = self._price_for
+        else:
+            self._price_fn = lambda consumption: 0
+        self._total_price = 0
+        self._os = platform.system()
+        if self._os == "Darwin":
+            self._os = "MacOS"
+        # self._mode == "first_time" means that the Tracker is just initialized
+        # self._mode == "run time" means that CO2 tracker is now running
+        # self._mode == "shut down" means that CO2 tracker is stopped
+        # self._mode == "training" means that CO2 tracker tracks training process
+        self._mode = "first_time"
+        # parameters to save during model training
+        self._parameters_to_save = ""
+        # if True, header of the file with encoded data has been already checked by the Tracker,
+        # so it is not read again while the file is not empty
+        self._enc_csv_created = False
+        # row of the .csv file, its values are updated in place on every measurement
+        self._row_buf = dict.fromkeys(
+            [
+                "id",
+                "project_name",
+                "experiment_description",
+                "epoch",
+                "start_time",
+                "duration(s)",
+                "power_consumption(kWh)",
+                "CO2_emissions(kg)",
+                "CPU_name",
+                "GPU_name",
+                "OS",
+                "region/country",
+                "cost",
+            ]
+        )
+        # writer of the .csv file, the file is kept opened during a run of the Tracker
+        self._csv = _CsvWriter(self.file_name, list(self._row_buf.keys()))
+        if writer_process and shared_memory is None and not self._ignore_warnings:
+            warnings.warn(
+                message="Shared memory is not available, so the .csv file will be written by the current process"
+            )
+        self._writer_process = bool(writer_process) and shared_memory is not None
+        # process writing the .csv file, event to stop it, row in shared memory with the latest measurement
+        # and columns, which values are passed through the shared row
+        self._writer = None
+        self._writer_stop = None
+        self._shared_row = None
+        self._shared_columns = None
+
+    def get_set_params(
+        self, project_name=None, experiment_description=None, file_name=None, measure_period=None, pue=None
+    ):
+        """
+        This function returns default Tracker attributes values:
+        project_name = ...
+        experiment_description = ...
+        file_name = ...
+        measure_period = ...
+        pue = ...
+
+        Parameters
+        ----------
+        project_name: str
+            Specified by user project name.
+            The default is None
+        experiment_description: str
+            Specified by user experiment description.
+            The default is None
+        file_name: str
+            Name of file to save the the results of calculations.
+            The default is None
+        measure_period: float
+            Period of power consumption measurements in seconds.
+            The more period the more time between measurements.
+            The default is None
+        pue: float
+            Power utilization efficiency.
+            It is ration of the total 'facility power' and 'IT equipment energy consumption'.
+            PUE is a measure of a data center power efficiency.
+            This parameter will be very essential during calculations using data centres facilities.
+            The default is None
+
+        Returns
+        -------
+        dictionary: dict
+
+
+        """
+        dictionary = dict()
+        if project_name is not None:
+            dictionary["project_name"] = project_name
+        else:
+            dictionary["project_name"] = "default project name"
+        if experiment_description is not None:
+            dictionary["experiment_description"] = experiment_description
+        else:
+            dictionary["experiment_description"] = "default experiment description"
+        if file_name is not None:
+            dictionary["file_name"] = file_name
+        else:
+            dictionary["file_name"] = "emission.csv"
+        if measure_period is not None:
+            dictionary["measure_period"] = measure_period
+        else:
+            dictionary["measure_period"] = 10
+        if pue is not None:
+            dictionary["pue"] = pue
+        else:
+            dictionary["pue"] = 1
+        # the config file is rewritten only if parameters are changed
+        if dictionary != get_params():
+            set_params(**dictionary)
+
+        return dictionary
+
+    def consumption(self):
+        """
+        This class method returns consumption
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        consumption: float
+            Power consumption of every device in a system.
+
+        """
+        return self._consumption
+
+    def price(self):
+        """
+        This class method returns total electricity price
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        total_price: float
+            Total price for electrical power spent.
+
+        """
+        return self._total_price
+
+    def id(self):
+        """
+        This class method returns the Tracker id
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        id: str
+            The Tracker's id. id is random UUID
+
+        """
+        return self._id
+
+    def emission_level(self):
+        """
+        This class method returns emission level
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        emission_level: float
+            emission_level is the mass of CO2 in kilos, which is produced  per every MWh of consumed energy.
+
+        """
+        return self._emission_level
+
+    def measure_period(self):
+        """
+        This class method returns measure period of Tracker
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        measure_period: float
+            Period of power consumption measurements.
+            The more period the more time between measurements.
+            The default is 10
+
+        """
+        return self._measure_period
+
+    def _update_row_buf(
+        self,
+    ):
+        """
+        This class method updates values of self._row_buf dictionary with the following keys:
+            id
+            project_name
+            experiment_description(model type etc.)
+            epoch
+            start_time
+            duration(s)
+            power_consumption(kWTh)
+            CO2_emissions(kg)
+            CPU_name
+            GPU_name
+            OS
+            region/country
+            cost
+        The dictionary is created once and reused for every measurement.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        row_buf: dict
+            Dictionary with all the attributes that should be written to .csv file
+
+        """
+        row_buf = self._row_buf
+        row_buf["id"] = self._id
+        row_buf["project_name"] = f"{self.project_name}"
+        row_buf["experiment_description"] = f"{self.experiment_description}"
+        row_buf["epoch"] = (
+            "epoch: " + str(self._current_epoch) + str(self._parameters_to_save) if self._mode == "training" else "N/A"
+        )
+        row_buf["start_time"] = self._start_time_str
+        # numbers are kept as they are, they are formatted only when the row is written
+        row_buf["duration(s)"] = time.time() - self._start_time
+        row_buf["power_consumption(kWh)"] = self._consumption
+        row_buf["CO2_emissions(kg)"] = self._consumption * self._emission_factor
+        row_buf["CPU_name"] = self._cpu_description
+        row_buf["GPU_name"] = self._gpu_description
+        row_buf["OS"] = self._os
+        row_buf["region/country"] = self._country
+        row_buf["cost"] = self._total_price
+
+        return row_buf
+
+    def _price_for(self, consumption, now_sec=None):
+        """
+        This class method calculates the price of consumed electricity
+        according to the pricing interval the given time belongs to.
+
+        Parameters
+        ----------
+        consumption: float
+            Electrical power spent in kWh
+        now_sec: float
+            Local time in seconds since midnight.
+            If None, the current time is used.
+            The default is None
+
+        Returns
+        -------
+        electricity_price: float
+            Price of electricity spent
+
+        """
+        if now_sec is None:
+            now = time.localtime()
+            now_sec = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
+        # the time before the earliest start belongs to the last interval, which passes midnight
+        index = np.searchsorted(self._px_starts, now_sec, side="right") - 1
+        return consumption * float(self._px_rates[index])
+
+    def _write_to_csv(
+        self,
+        add_new=False,
+    ):
+        """
+        This class method writes to .csv file calculation results.
+        Results is a table with the following columns:
+            project_name
+            experiment_description(model type etc.)
+            start_time
+            duration(s)
+            power_consumption(kWTh)
+            CO2_emissions(kg)
+            CPU_name
+            GPU_name
+            OS
+            region/country
+
+        Values of the row are put to the pending rows of self._csv, which are written to the file at once by its "flush" method.
+        Until the rows are written, the latest pending row is replaced by the new one.
+
+        Parameters
+        ----------
+        add_new: bool
+            Parameter, defining if function should add additional row to the dataframe
+            "add_new" == True when new epoch in training was started
+        parameters_to_save: str
+            String with parameters user wants to save.
+            The string come from ".new_epoch" method.
+
+        Returns
+        -------
+        attributes_dict: dict
+            Dictionary with all the attributes that should be written to .csv file.
+            It is self._row_buf, so it is changed by the next measurement
+
+        """
+        attributes_dict = self._update_row_buf()
+        if self._shared_row is not None and self._mode != "training":
+            # the row is written by the writer process
+            self._shared_row.write([attributes_dict[column] for column in self._shared_columns])
+            self._mode = "run time"
+            return attributes_dict
+        self._csv.add_row(tuple(attributes_dict.values()), add_new)
+        # during training rows are written at the end of every epoch
+        if self._mode != "training":
+            self._csv.flush(self._id)
+
+        self._mode = "run time" if self._mode != "training" else "training"
+        return attributes_dict
+
+    def _func_for_sched(self, add_new=False):
+        """
+        This class method is a function, that is run in a separate thread
+        during a Tracker work with period "measure_period"(The Tracker class parameter).
+        It calculates CPU, GPU and RAM power consumption and writes results to a .csv file.
+
+        Parameters
+        ----------
+        add_new: bool
+            Parameter, defining if function should add additional row to the dataframe
+            "add_new" == True when new epoch in training was started
+
+        Returns
+        -------
+        attributes_dict: dict
+            Dictionary with all the attributes that should be written to .csv file
+
+        """
+        cpu_consumption = self._cpu.calculate_consumption()
+        ram_consumption = self._ram.calculate_consumption()
+        gpu_consumption = self._measure_gpu()
+        tmp_consumption = (cpu_consumption + gpu_consumption + ram_consumption) * self._pue
+        self._total_price += self._price_fn(tmp_consumption)
+        self._consumption += tmp_consumption
+
+        # self._write_to_csv returns attributes_dict
+        return self._write_to_csv(add_new)
+
+    def _set_start_time(self):
+        """
+        This class method sets start time of the current calculation and its string representation
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        self._start_time = time.time()
+        self._start_time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._start_time))
+
+    def _run_loop(self):
+        """
+        This class method is run in a separate thread and calls self._func_for_sched
+        every "measure_period" seconds until self._stop_event is set.
+        Measurements are scheduled by monotonic clock, so they don't drift.
+        If a measurement takes longer than "measure_period", missed measurements are skipped.
+        If a measurement fails, a warning is shown and the next measurements are still made.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        next_time = time.monotonic() + self._measure_period
+        while not self._stop_event.wait(max(0, next_time - time.monotonic())):
+            try:
+                self._func_for_sched()
+            except Exception as exception:
+                if not self._ignore_warnings:
+                    warnings.warn(message=f"Measurement of power consumption failed: {exception!r}")
+            next_time = max(next_time + self._measure_period, time.monotonic())
+
+    def _stop_thread(self):
+        """
+        This class method stops the thread with measurements and waits until the current measurement is finished
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+        self._thread = None
+        self._stop_event = None
+
+    def _start_writer(self):
+        """
+        This class method starts the process writing the .csv file.
+        Values of the row, which don't change during the run, are passed to the process once,
+        the rest of them are passed through shared memory on every measurement.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        row = dict(self._update_row_buf())
+        self._shared_columns = ["duration(s)", "power_consumption(kWh)", "CO2_emissions(kg)"]
+        # without electricity pricing the cost is always 0
+        if self._electricity_pricing is not None:
+            self._shared_columns.append("cost")
+        self._shared_row = _SharedRow(len(self._shared_columns))
+        self._writer_stop = multiprocessing.Event()
+        self._writer = multiprocessing.Process(
+            target=_run_writer,
+            args=(
+                self.file_name,
+                row,
+                self._shared_columns,
+                self._shared_row.shm.name,
+                self._shared_row.counter,
+                self._writer_stop,
+                self._measure_period,
+            ),
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _stop_writer(self):
+        """
+        This class method stops the process writing the .csv file
+        and waits until it writes the latest measurement
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._writer is not None:
+            self._writer_stop.set()
+            self._writer.join()
+            self._shared_row.unlink()
+            if self._writer.exitcode and not self._ignore_warnings:
+                warnings.warn(
+                    message=f"Process writing {self.file_name} exited with code {self._writer.exitcode}"
+                )
+        self._writer = None
+        self._writer_stop = None
+        self._shared_row = None
+
+    def _reset_state(self):
+        """
+        This class method brings the Tracker back to the state it has right after initialization,
+        so it can be started again as a new one.
+        The measurement thread is stopped and the .csv file is closed, if they weren't.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        self._stop_thread()
+        self._stop_writer()
+        self._csv.close()
+        self._consumption = 0
+        self._total_price = 0
+        self._start_time = None
+        self._mode = "first_time"
+
+    def start_training(self, start_epoch=1):
+        """
+        This class method starts the Tracker work and signalize that it should track the training process.
+        It initializes fields of CPU and GPU classes,
+        IMPORTANT: during training tracking all the calculations is written to file only after ".new_epoch" method was run
+
+        Parameters
+        ----------
+        start_epoch: int
+            Number of epoch a training should start with.
+
+        Returns
+        -------
+        No returns
+
+        """
+        if not isinstance(start_epoch, int):
+            raise TypeError(f'"start_epoch" parameter must be of int type. Now, it is {type(start_epoch)}')
+
+        self._mode = "training"
+
+        self._current_epoch = start_epoch
+        self._cpu = CPU(cpu_processes=self._cpu_processes, ignore_warnings=self._ignore_warnings)
+        self._gpu = GPU(ignore_warnings=self._ignore_warnings)
+        self._ram = RAM(ignore_warnings=self._ignore_warnings)
+        self._cpu_description = f"{self._cpu.name()}/{self._cpu.cpu_num()} device(s), TDP:{self._cpu.tdp()}"
+        self._gpu_description = f"{self._gpu.name()} {self._gpu.gpu_num()} device(s)"
+        self._measure_gpu = self._gpu.calculate_consumption if self._gpu.is_gpu_available else (lambda: 0)
+        self._id = str(uuid.uuid4())
+        self._csv.new_run(self.file_name)
+        self._static_encoded = None
+        self._set_start_time()
+
+    def new_epoch(self, parameters_dict):
+        """
+        This class method starts tracking new epoch.
+        It calls "._func_for_sched" method, and signalize that new row should be created and added to the dataframe
+
+        Parameters
+        ----------
+        parameters_dict: dict
+            Dictionary with parameters user wants to save during current epoch
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._mode != "training":
+            raise IncorrectMethodSequenceError(
+                'You can run method ".new_epoch" only after method ".start_training" was run'
+            )
+        self._parameters_to_save = ", "
+        for key in parameters_dict:
+            self._parameters_to_save += key + ": "
+            self._parameters_to_save += str(parameters_dict[key]) + ", "
+        # self._func_for_sched returns attributes_dict.
+        attributes_dict = self._func_for_sched(add_new=True)
+        self._csv.flush(self._id)
+        # We put it into self._func_for_encoding method in order to encode calculations
+        if self._encode_file is not None:
+            self._func_for_encoding(attributes_dict)
+        self._current_epoch += 1
+        self._parameters_to_save = ""
+        self._consumption = 0
+        self._total_price = 0
+        self._set_start_time()
+
+    def start(self):
+        """
+        This class method starts the Tracker work. It initializes fields of CPU and GPU classes
+        and starts a thread, which runs the self._func_for_sched function every "measure_period" seconds.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._mode == "training":
+            raise IncorrectMethodSequenceError(
+                """
+You have already run ".start_training" method.
+Please, use the interface for training: ".start_training", ".new_epoch", and "stop_training"
+                """
+            )
+        self._stop_thread()
+        self._stop_writer()
+        self._cpu = CPU(cpu_processes=self._cpu_processes, ignore_warnings=self._ignore_warnings)
+        self._gpu = GPU(ignore_warnings=self._ignore_warnings)
+        self._ram = RAM(ignore_warnings=self._ignore_warnings)
+        self._cpu_description = f"{self._cpu.name()}/{self._cpu.cpu_num()} device(s), TDP:{self._cpu.tdp()}"
+        self._gpu_description = f"{self._gpu.name()} {self._gpu.gpu_num()} device(s)"
+        self._measure_gpu = self._gpu.calculate_consumption if self._gpu.is_gpu_available else (lambda: 0)
+        self._id = str(uuid.uuid4())
+        self._csv.new_run(self.file_name)
+        self._static_encoded = None
+        self._mode = "first_time"
+        self._set_start_time()
+        if self._writer_process:
+            self._start_writer()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def stop_training(
+        self,
+    ):
+        """
+        This class method stops the Tracker work during a training process.
+        It also writes to file final calculation results.
+
+        Parameters
+        ----------
+        No returns
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._mode != "training" or self._start_time is None:
+            raise IncorrectMethodSequenceError(
+                """
+You should run ".start_training" method before ".stop_training" method
+                """
+            )
+        self._csv.flush(self._id)
+        self._csv.close()
+        self._consumption = 0
+        self._mode = "shut down"
+
+    def stop(
+        self,
+    ):
+        """
+        This class method stops the Tracker work, stops the thread running self._func_for_sched,
+        it also writes to file final calculation results.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._mode == "training":
+            self.stop_training()
+            return
+        if self._start_time is None:
+            raise Exception("Need to first start the tracker by running tracker.start() or tracker.start_training()")
+        self._stop_thread()
+        # self._func_for_sched returns attributes_dict
+        attributes_dict = self._func_for_sched()
+        self._csv.flush(self._id)
+        self._stop_writer()
+        self._csv.close()
+        if self._encode_file is not None:
+            self._func_for_encoding(attributes_dict)
+        self._start_time = None
+        self._consumption = 0
+        self._mode = "shut down"
+
+    def _func_for_encoding(self, attributes_dict):
+        """
+        This function encodes all calculated data and attributes and writes it to file.
+        File name depends on 'encode_file' parameter.
+        More details on file name can be seen in 'encode_file' parameter description in the Tracker class.
+
+        Parameters
+        ----------
+        attributes_dict: dict
+            Dictionary with all the attributes that should be written to .csv file.
+            The dictionary is not modified, encoded values are put to a new one.
+
+        Returns
+        -------
+        No returns
+
+        """
+        if self._static_encoded is None:
+            self._static_encoded = {key: encode(str(attributes_dict[key])) for key in self._STATIC_COLUMNS}
+        static_encoded = self._static_encoded
+        attributes_dict = {
+            key: static_encoded[key] if key in static_encoded else encode(str(value))
+            for key, value in attributes_dict.items()
+        }
+
+        # the file is opened in append mode, so it is created but not truncated before it is locked
+        with locked_open(self._encode_file, "ab+") as file:
+            columns = self._csv.format_line(attributes_dict.keys())
+            if self._enc_csv_created and os.fstat(file.fileno()).st_size:
+                header = columns
+            else:
+                file.seek(0)
+                header = file.readline()
+            if not header or header == columns:
+                if not header:
+                    file.write(columns)
+                file.write(self._csv.format_line(attributes_dict.values()))
+                self._enc_csv_created = True
+            else:
+                # the file was created by an older version, so its columns are aligned with pandas
+                file.seek(0)
+                attributes_dataframe = pd.read_csv(file, dtype=str, keep_default_na=False)
+                attributes_dataframe = pd.concat(
+                    [
+                        attributes_dataframe,
+                        pd.DataFrame([attributes_dict]),
+                    ],
+                    ignore_index=True,
+                    axis=0,
+                )
+                file.seek(0)
+                file.truncate()
+                file.write(attributes_dataframe.to_csv(index=False).encode("utf-8"))
+
+
+class _SharedRow:
+    """
+    Row of float values in shared memory with a single writer and a single reader.
+    The writer increments the counter before and after changing the values,
+    so the reader sees an odd or a changed counter, if the values were read during the change, and reads them again.
+    So, no lock is needed.
+    """
+
+    def __init__(self, row_len, name=None, counter=None):
+        """
+        This class method creates a new shared row or attaches to the existing one
+
+        Parameters
+        ----------
+        row_len: int
+            Number of values in the row
+        name: str
+            Name of shared memory block of the existing row.
+            If None, a new row is created.
+            The default is None
+        counter: multiprocessing.Value
+            Counter of changes of the existing row.
+            The default is None
+
+        Returns
+        -------
+        _SharedRow: _SharedRow
+            Object of class _SharedRow
+
+        """
+        self._record = struct.Struct(f"<{row_len}d")
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=self._record.size)
+            self.counter = multiprocessing.Value("Q", 0, lock=False)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.counter = counter
+
+    def write(self, values):
+        """
+        This class method replaces values of the row.
+        It must be called only by the writer.
+
+        Parameters
+        ----------
+        values: list
+            Values of the row
+
+        Returns
+        -------
+        No returns
+
+        """
+        count = self.counter.value
+        self.counter.value = count + 1
+        self._record.pack_into(self.shm.buf, 0, *values)
+        self.counter.value = count + 2
+
+    def read(self):
+        """
+        This class method reads values of the row.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        version: int
+            Number of writes to the row
+        values: tuple
+            Values of the row, None if nothing was written
+
+        """
+        while True:
+            count = self.counter.value
+            if not count:
+                return 0, None
+            if count % 2:
+                # the values are being changed right now
+                time.sleep(0)
+                continue
+            values = self._record.unpack_from(self.shm.buf, 0)
+            if self.counter.value == count:
+                return count // 2, values
+
+    def close(self):
+        """
+        This class method detaches from the shared memory of the row
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        self.shm.close()
+
+    def unlink(self):
+        """
+        This class method detaches from the shared memory of the row and frees it.
+        It must be called only by the creator of the row.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        No returns
+
+        """
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _run_writer(file_name, row, shared_columns, shm_name, counter, stop_event, period):
+    """
+    This function is run in the writer process.
+    Every "period" seconds and after the stop event is set,
+    it writes the row from shared memory to .csv file, if the row was changed.
+    During a run rows replace each other in the file, so only the latest measurement is needed.
+
+    Parameters
+    ----------
+    file_name: str
+        Name of .csv file
+    row: dict
+        Row of the .csv file with values, which don't change during the run
+    shared_columns: list
+        Columns, which values are passed through shared memory
+    shm_name: str
+        Name of shared memory block of the row
+    counter: multiprocessing.Value
+        Counter of changes of the row
+    stop_event: multiprocessing.Event
+        Event, which is set when the Tracker stops
+    period: float
+        Period of checking the row in seconds
+
+    Returns
+    -------
+    No returns
+
+    """
+    shared_row = _SharedRow(len(shared_columns), name=shm_name, counter=counter)
+    writer = _CsvWriter(file_name, list(row.keys()))
+    written = 0
+    stopped = False
+    try:
+        while not stopped:
+            stopped = stop_event.wait(period)
+            version, values = shared_row.read()
+            if version == written:
+                continue
+            row.update(zip(shared_columns, values))
+            writer.add_row(tuple(row.values()))
+            # the writer doesn't block the tracked code, so the file can be synced on every write
+            writer.flush(row["id"], sync=True)
+            written = version
+    finally:
+        writer.close()
+        shared_row.close()
+
+
+class _TrackerPool:
+    """
+    Pool of Tracker objects, used by the "track" decorator.
+    Creation of a Tracker is expensive (reading of parameters, defining of the country etc.),
+    so the Trackers are reused between calls of decorated functions.
+    """
+
+    def __init__(self, factory, max_size=8):
+        """
+        This class method initializes an empty pool
+
+        Parameters
+        ----------
+        factory: callable
+            Function creating a new Tracker
+        max_size: int
+            Maximal number of Trackers kept in the pool.
+            The default is 8
+
+        Returns
+        -------
+        _TrackerPool: _TrackerPool
+            Object of class _TrackerPool
+
+        """
+        # pairs of default parameters, a Tracker was created with, and the Tracker
+        self._stack = []
+        self._factory = factory
+        self._max = max_size
+
+    def acquire(self):
+        """
+        This class method takes a Tracker from the pool or creates a new one, if the pool is empty.
+        Trackers created with other default parameters (see "set_params" function) are dropped.
+
+        Parameters
+        ----------
+        No parameters
+
+        Returns
+        -------
+        params: dict
+            Default parameters the Tracker was created with
+        tracker: Tracker
+            Tracker ready to be started
+
+        """
+        params = get_params()
+        while True:
+            try:
+                tracker_params, tracker = self._stack.pop()
+            except IndexError:
+                tracker = self._factory()
+                # the Tracker may write its parameters as the default ones
+                return get_params(), tracker
+            if tracker_params == params:
+                return tracker_params, tracker
+
+    def release(self, params, tracker):
+        """
+        This class method resets the Tracker and puts it back to the pool, if the pool is not full
+
+        Parameters
+        ----------
+        params: dict
+            Default parameters the Tracker was created with
+        tracker: Tracker
+            Tracker taken from the pool by "acquire" method
+
+        Returns
+        -------
+        No returns
+
+        """
+        tracker._reset_state()
+        if len(self._stack) < self._max:
+            self._stack.append((params, tracker))
+
+
+_POOL = _TrackerPool(Tracker)
@@ -1,6 +1,7 @@
 import os
+import contextlib
 import psutil
-from pkg_resources import resource_stream
+from pkg_resources import resource_stream, resource_filename
 import json
 import pandas as pd
 import string
@@ -11,6 +12,13 @@ import datetime
 from eco2ai.tools.tools_cpu import all_available_cpu
 from eco2ai.tools.tools_gpu import all_available_gpu
 
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
 
 class FileDoesNotExistsError(Exception):
     pass
@@ -74,6 +82,81 @@ def is_file_opened(
     return result
 
 
+@contextlib.contextmanager
+def file_lock(
+    file,
+    shared=False,
+):
+    """
+        This function is a context manager, that holds an exclusive advisory lock on the opened file.
+        If the file is locked by another process, it waits until the lock is released.
+        fcntl.flock is used on POSIX systems and msvcrt.locking is used on Windows.
+
+        Parameters
+        ----------
+        file: file object
+            Opened file, that is going to be locked
+        shared: bool
+            If True, a shared lock is held, so the file can be opened only for reading
+            and other readers don't wait for each other.
+            msvcrt has no shared locks, so on Windows the lock is always exclusive.
+            The default is False
+
+        Returns
+        -------
+        file: file object
+            The same file object
+
+    """
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    else:
+        # msvcrt locks bytes starting from the current position, so the first byte is always locked
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+    try:
+        yield file
+    finally:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def locked_open(
+    needed_file,
+    mode="r",
+    **kwargs
+):
+    """
+        This function is a context manager, that opens given file and holds an exclusive advisory lock on it
+
+        Parameters
+        ----------
+        needed_file: str
+            Name of file that is going to be opened
+        mode: str
+            Mode in which the file is opened
+        kwargs: dict
+            Other parameters of built-in "open" function
+
+        Returns
+        -------
+        file: file object
+            Opened and locked file
+
+    """
+    with open(needed_file, mode, **kwargs) as file, file_lock(file):
+        yield file
+
+
+# content of the config file with default Tracker parameters and (mtime, size) of the file it was read at.
+# The file is read again only if it is modified
+_params_cache = {"file_stat": None, "params": None}
+
+
 class NoCountryCodeError(Exception):
     pass
 
@@ -257,6 +340,37 @@ Now, total duration equals: {summ}
         )
 
 
+def electricity_pricing_table(
+    electricity_pricing,
+):
+    """
+    This function takes electricity pricing dictionary and
+    converts it to the table of intervals sorted by their start time.
+    The table is used to find the price for any time of a day by binary search.
+    The dictionary should be checked with 'electricity_pricing_check' function beforehand.
+
+    Parameters
+    ----------
+    electricity_pricing: dict
+        Dictionary with time intervals as keys and electricity price during that intervals as values.
+        More details on its construction can be seen in 'electricity_pricing_check' function.
+
+    Returns
+    -------
+    tuple: tuple
+        A tuple, where the first element is a sorted array of intervals start times
+        in seconds since midnight and the second element is an array of corresponding prices
+    """
+    starts = []
+    for key in electricity_pricing:
+        hours, minutes = key.split("-")[0].split(":")
+        starts.append(int(hours) * 3600 + int(minutes) * 60)
+    starts = np.array(starts, dtype=np.float64)
+    prices = np.array(list(electricity_pricing.values()), dtype=np.float64)
+    order = np.argsort(starts)
+    return starts[order], prices[order]
+
+
 def calculate_price( 
     electricity_pricing,
     kwh_energy,
@@ -351,7 +465,7 @@ def set_params(**params):
 
     """
     dictionary = dict()
-    filename = resource_stream('eco2ai', 'data/config.txt').name
+    filename = resource_filename('eco2ai', 'data/config.txt')
     for param in params:
         dictionary[param] = params[param]
     if "project_name" not in dictionary:
@@ -364,8 +478,14 @@ def set_params(**params):
         dictionary["measure_period"] = 10
     if "pue" not in dictionary:
         dictionary["pue"] = 1
-    with open(filename, 'w') as json_file:
-        json_file.write(json.dumps(dictionary))
+    content = json.dumps(dictionary)
+    with locked_open(filename, 'a') as json_file:
+        json_file.truncate(0)
+        json_file.write(content)
+        json_file.flush()
+        file_stat = os.fstat(json_file.fileno())
+    _params_cache["file_stat"] = (file_stat.st_mtime_ns, file_stat.st_size)
+    _params_cache["params"] = json.loads(content)
 
 
 def get_params():
@@ -388,40 +508,47 @@ def get_params():
             Dictionary of Tracker parameters: project_name, experiment_description, file_name, measure_period and pue
 
     """
-    filename = resource_stream('eco2ai', 'data/config.txt').name
-    if not os.path.isfile(filename):
-        with open(filename, "w"):
-            pass
-    with open(filename, "r") as json_file:
-        if os.path.getsize(filename):
-            dictionary = json.loads(json_file.read())
-        else:
-            dictionary = {
-                "project_name": "Default project name",
-                "experiment_description": "no experiment description",
-                "file_name": "emission.csv",
-                "measure_period": 10,
-                "pue": 1,
-                }
-    return dictionary
-
-
-def encode(f_string):
+    filename = resource_filename('eco2ai', 'data/config.txt')
+    default_params = {
+        "project_name": "Default project name",
+        "experiment_description": "no experiment description",
+        "file_name": "emission.csv",
+        "measure_period": 10,
+        "pue": 1,
+        }
+    try:
+        file_stat = os.stat(filename)
+        if _params_cache["file_stat"] == (file_stat.st_mtime_ns, file_stat.st_size):
+            return dict(_params_cache["params"])
+        # the shared lock keeps the file from being read while "set_params" rewrites it,
+        # the file is opened only for reading, so the package can be installed to a read-only directory
+        with open(filename, "r") as json_file, file_lock(json_file, shared=True):
+            content = json_file.read()
+            file_stat = os.fstat(json_file.fileno())
+    except FileNotFoundError:
+        return default_params
+    dictionary = json.loads(content) if content else default_params
+    _params_cache["file_stat"] = (file_stat.st_mtime_ns, file_stat.st_size)
+    _params_cache["params"] = dictionary
+    return dict(dictionary)
+
+
+def _encoding_table(n=5):
     """
-        This function encodes given string.
+        This function creates translation table for "encode" function.
+        Every symbol is replaced by the symbol, which is n positions further in the shuffled alphabet.
 
         Parameters
         ----------
-        f_string: str
-            A string user wants to encode
+        n: int
+            Shift of symbols in the alphabet
 
         Returns
         -------
-        encoded_string: str
-            Resultant encoded string
-    
+        table: dict
+            Translation table for str.translate method
+
     """
-    n=5
     symbols = string.printable[:95] + 'йцукенгшщзхъфывапролджэячсмитьбюёЁЙЦУКЕНГШЩЗХЪФЫВАПРОЛДЖЭЯЧСМИТЬБЮ'
     symbols = symbols.replace(',', '')
     symbols = symbols.replace('\"', '')
@@ -430,15 +557,32 @@ def encode(f_string):
     for i in range(0,int(len(symbols)/2)):
         s += symbols[i] + symbols[i+int(len(symbols)/2)]
     symbols = s
+
+    table = dict()
+    for index in range(len(symbols) - n):
+        table.setdefault(ord(symbols[index]), symbols[index+n])
+    return table
+
+
+_ENCODING_TABLE = _encoding_table()
+
+
+def encode(f_string):
+    """
+        This function encodes given string.
+
+        Parameters
+        ----------
+        f_string: str
+            A string user wants to encode
+
+        Returns
+        -------
+        encoded_string: str
+            Resultant encoded string
     
-    encoded_string = ""
-    for letter in f_string:
-        try:
-            index = symbols.index(letter)
-            encoded_string += symbols[index+n]
-        except:
-            encoded_string += letter
-    return encoded_string
+    """
+    return f_string.translate(_ENCODING_TABLE)
 
 
 def encode_dataframe(values):
@@ -1,10 +1,21 @@
+import re
+import sys
 from setuptools import setup
 
-with open("README.md", "r") as f:
-    long_description = f.read()
+# version is parsed, not imported, so dependencies of the package are not needed to run setup.py
+with open("eco2ai/emission_track.py", "r") as f:
+    __version__ = re.search(r"^__version__ = ['\"]([^'\"]+)['\"]", f.read(), re.M).group(1)
+
+# README is read only by the commands, which write package metadata,
+# so queries like "python setup.py --version" don't read it
+METADATA_COMMANDS = ("sdist", "bdist_wheel", "bdist_egg", "install", "develop", "egg_info", "dist_info")
+if any(command in sys.argv for command in METADATA_COMMANDS):
+    with open("README.md", "r") as f:
+        long_description = f.read()
+else:
+    long_description = ""
 
 DEPENDENCIES = [
-    "APScheduler",
     "pynvml>=5.6.2",
     "psutil",
     "py-cpuinfo",
@@ -13,8 +24,10 @@ DEPENDENCIES = [
 setup(
     name = 'eco2ai',
     author=["Vladimir Lazarev", 'Nikita Zakharenko', 'Alexey Korovin', 'Semyon Budyonny', 'Leonid Zhukov'],
-    description = long_description,
-    packages = ['eco2ai'],
+    description = "emission tracking library",
+    long_description = long_description,
+    long_description_content_type = "text/markdown",
+    packages = ['eco2ai', 'eco2ai.tools'],
     install_requires=DEPENDENCIES,
     package_data={
         "eco2ai": [